@@ -168,6 +168,11 @@ class ModmailBot(commands.Bot):
         except Exception:
             logger.critical("Fatal exception", exc_info=True)
         finally:
+            # Write out any config changes still waiting on a debounced update
+            try:
+                self.loop.run_until_complete(self.config.flush())
+            except Exception:
+                logger.critical("Failed to write pending config changes.", exc_info=True)
             self.loop.run_until_complete(self.logout())
             for task in asyncio.all_tasks(self.loop):
                 task.cancel()
@@ -319,8 +324,12 @@ class ModmailBot(commands.Bot):
         return self.config["blocked"]
 
     @property
-    def blocked_whitelisted_users(self) -> typing.List[str]:
-        return self.config["blocked_whitelist"]
+    def blocked_whitelisted_users(self) -> typing.Set[str]:
+        whitelist = self.config["blocked_whitelist"]
+        if not isinstance(whitelist, set):
+            # Stored as a list, but only ever used for membership checks
+            whitelist = self.config["blocked_whitelist"] = set(whitelist)
+        return whitelist
 
     @property
     def prefix(self) -> str:
@@ -381,7 +390,7 @@ class ModmailBot(commands.Bot):
         self._connected.set()
 
     async def setup_indexes(self):
-        """Setup text indexes so we can use the $search operator"""
+        """Setup the logs indexes, including the text index used by the $search operator"""
         coll = self.db.logs
         index_name = "messages.content_text_messages.author.name_text_key_text"
 
@@ -399,6 +408,11 @@ class ModmailBot(commands.Bot):
             await coll.create_index(
                 [("messages.content", "text"), ("messages.author.name", "text"), ("key", "text")]
             )
+
+        # Used by the "logs closed-by" lookups
+        await coll.create_index([("guild_id", 1), ("open", 1), ("closer.id", 1)])
+        # Used by the per-recipient lookups
+        await coll.create_index([("recipient.id", 1), ("open", 1)])
         logger.debug("Successfully configured and verified database indexes.")
 
     async def on_ready(self):
@@ -548,9 +562,10 @@ class ModmailBot(commands.Bot):
             delta = human_timedelta(min_account_age)
             logger.debug("Blocked due to account age, user %s.", author.name)
 
-            if str(author.id) not in self.blocked_users:
+            uid = str(author.id)
+            if uid not in self.blocked_users:
                 new_reason = f"System Message: New Account. Required to wait for {delta}."
-                self.blocked_users[str(author.id)] = new_reason
+                self.blocked_users[uid] = new_reason
 
             return False
         return True
@@ -574,24 +589,26 @@ class ModmailBot(commands.Bot):
             delta = human_timedelta(min_guild_age)
             logger.debug("Blocked due to guild age, user %s.", author.name)
 
-            if str(author.id) not in self.blocked_users:
+            uid = str(author.id)
+            if uid not in self.blocked_users:
                 new_reason = f"System Message: Recently Joined. Required to wait for {delta}."
-                self.blocked_users[str(author.id)] = new_reason
+                self.blocked_users[uid] = new_reason
 
             return False
         return True
 
     def check_manual_blocked(self, author: discord.Member) -> bool:
-        if str(author.id) not in self.blocked_users:
+        uid = str(author.id)
+        if uid not in self.blocked_users:
             return True
 
-        blocked_reason = self.blocked_users.get(str(author.id)) or ""
+        blocked_reason = self.blocked_users[uid] or ""
         now = datetime.utcnow()
 
         if blocked_reason.startswith("System Message:"):
             # Met the limits already, otherwise it would've been caught by the previous checks
             logger.debug("No longer internally blocked, user %s.", author.name)
-            self.blocked_users.pop(str(author.id))
+            self.blocked_users.pop(uid)
             return True
         # etc "blah blah blah... until 2019-10-14T21:12:45.559948."
         end_time = re.search(r"until ([^`]+?)\.$", blocked_reason)
@@ -608,7 +625,7 @@ class ModmailBot(commands.Bot):
             after = (datetime.fromisoformat(end_time.group(1)) - now).total_seconds()
             if after <= 0:
                 # No longer blocked
-                self.blocked_users.pop(str(author.id))
+                self.blocked_users.pop(uid)
                 logger.debug("No longer blocked, user %s.", author.name)
                 return True
         logger.debug("User blocked, user %s.", author.name)
@@ -635,16 +652,17 @@ class ModmailBot(commands.Bot):
         else:
             author = member
 
-        if str(author.id) in self.blocked_whitelisted_users:
-            if str(author.id) in self.blocked_users:
-                self.blocked_users.pop(str(author.id))
+        uid = str(author.id)
+        if uid in self.blocked_whitelisted_users:
+            if uid in self.blocked_users:
+                self.blocked_users.pop(uid)
                 await self.config.update()
             return False
 
-        blocked_reason = self.blocked_users.get(str(author.id)) or ""
+        blocked_reason = self.blocked_users.get(uid) or ""
 
         if not self.check_account_age(author) or not self.check_guild_age(author):
-            new_reason = self.blocked_users.get(str(author.id))
+            new_reason = self.blocked_users.get(uid)
             if new_reason != blocked_reason:
                 if send_message:
                     await channel.send(
@@ -1,7 +1,9 @@
 import asyncio
+import json
 import re
+from collections import OrderedDict, defaultdict, deque
+from contextlib import asynccontextmanager, suppress
 from datetime import datetime
-from itertools import zip_longest
 from typing import Optional, Union
 from types import SimpleNamespace
 
@@ -21,12 +23,138 @@ from core.utils import *
 
 logger = getLogger(__name__)
 
+# Only the fields read when formatting log embeds
+LOG_EMBED_PROJECTION = {
+    "messages": {"$slice": 5},
+    "created_at": 1,
+    "key": 1,
+    "recipient": 1,
+    "creator.id": 1,
+    "closer": 1,
+}
+
+MENTION_KEYWORDS = frozenset({"here", "everyone", "@here", "@everyone"})
+
+# Fetched users are kept for an hour so username changes still show up eventually
+USER_FETCH_CACHE_SIZE = 1024
+USER_FETCH_CACHE_TTL = 3600
+
+
+def _mention(user) -> str:
+    # `User` falls back to a bare `discord.Object` for unknown IDs
+    try:
+        return user.mention
+    except AttributeError:
+        return f"`{user.id}`"
+
+
+def _name(user) -> str:
+    try:
+        return user.name
+    except AttributeError:
+        return f"`{user.id}`"
+
+
+def _parse_timestamp(timestamp: str) -> datetime:
+    # Logs store `str(datetime)`, only fall back to dateutil for anything unusual
+    try:
+        return datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    except ValueError:
+        return parser.parse(timestamp)
+
 
 class Modmail(commands.Cog):
     """Commands directly related to Modmail functionality."""
 
     def __init__(self, bot):
         self.bot = bot
+        self._snippet_pages_cache = None
+        self._rate_limit_windows = defaultdict(deque)
+        self._rate_limit_locks = defaultdict(asyncio.Lock)
+        self._emoji_cache = None
+        self._user_fetch_cache = OrderedDict()
+        self._escaped_name_cache = OrderedDict()
+        self._dm_embeds = None
+
+    def cog_unload(self):
+        self.bot.loop.create_task(self.bot.config.flush())
+
+    @commands.Cog.listener()
+    async def on_config_update(self, key):
+        if key in {"sent_emoji", "blocked_emoji"}:
+            self._emoji_cache = None
+        elif key in {"main_color", "error_color"}:
+            self._dm_embeds = None
+            if key == "main_color":
+                self._invalidate_snippet_pages()
+
+    @commands.Cog.listener()
+    async def on_guild_emojis_update(self, guild, before, after):
+        # A cached custom emoji may have been deleted
+        self._emoji_cache = None
+
+    async def _get_emojis(self):
+        """Same as `bot.retrieve_emoji`, cached until the emoji configs change."""
+        if self._emoji_cache is None:
+            self._emoji_cache = await self.bot.retrieve_emoji()
+        return self._emoji_cache
+
+    async def _add_sent_reaction(self, message):
+        sent_emoji, _ = await self._get_emojis()
+        if not await self.bot.add_reaction(message, sent_emoji):
+            # The emoji may be gone, resolve it again next time
+            self._emoji_cache = None
+
+    @staticmethod
+    async def _safe_pin(message):
+        try:
+            await message.pin()
+        except discord.HTTPException:
+            # Most likely the channel already has 50 pins
+            logger.warning("Failed to pin message %s.", message.id, exc_info=True)
+
+    @asynccontextmanager
+    async def _rate_limit(self, route: str, rate: int = 30, per: float = 60):
+        """
+        Allows at most `rate` calls to `route` within any `per` seconds,
+        queueing the callers once the window is full.
+        """
+        window = self._rate_limit_windows[route]
+        async with self._rate_limit_locks[route]:
+            now = self.bot.loop.time()
+            while window and now - window[0] >= per:
+                window.popleft()
+            if len(window) >= rate:
+                await asyncio.sleep(per - (now - window.popleft()))
+            window.append(self.bot.loop.time())
+        yield
+
+    async def _fetch_user(self, user_id: int) -> Optional[discord.User]:
+        """
+        Resolves a user from the client's cache, then from the recently
+        fetched users, and only then from the API.
+        Returns `None` if the user does not exist.
+        """
+        user = self.bot.get_user(user_id)
+        if user is not None:
+            return user
+
+        now = self.bot.loop.time()
+        cached = self._user_fetch_cache.get(user_id)
+        if cached is not None and now - cached[1] < USER_FETCH_CACHE_TTL:
+            self._user_fetch_cache.move_to_end(user_id)
+            return cached[0]
+
+        try:
+            user = await self.bot.fetch_user(user_id)
+        except discord.NotFound:
+            return None
+
+        self._user_fetch_cache[user_id] = (user, now)
+        self._user_fetch_cache.move_to_end(user_id)
+        if len(self._user_fetch_cache) > USER_FETCH_CACHE_SIZE:
+            self._user_fetch_cache.popitem(last=False)
+        return user
 
     @commands.command()
     @trigger_typing
@@ -81,7 +209,9 @@ class Modmail(commands.Cog):
             name="Modmail", overwrites=overwrites
         )
 
-        await category.edit(position=0)
+        # discord.py's create_category doesn't take a position, only move it if needed
+        if category.position != 0:
+            await category.edit(position=0)
 
         log_channel = await self.bot.modmail_guild.create_text_channel(
             name="bot-logs", category=category
@@ -103,19 +233,23 @@ class Modmail(commands.Cog):
         )
 
         embed.set_footer(text=f'Type "{self.bot.prefix}help" for a complete list of commands.')
-        await log_channel.send(embed=embed)
 
         self.bot.config["main_category_id"] = category.id
         self.bot.config["log_channel_id"] = log_channel.id
 
+        # Only report success once the new channels are saved
         await self.bot.config.update()
-        await ctx.send(
-            "**Successfully set up server.**\n"
-            "Consider setting permission levels to give access to roles "
-            "or users the ability to use Modmail.\n\n"
-            f"Type:\n- `{self.bot.prefix}permissions` and `{self.bot.prefix}permissions add` "
-            "for more info on setting permissions.\n"
-            f"- `{self.bot.prefix}config help` for a list of available customizations."
+
+        await asyncio.gather(
+            log_channel.send(embed=embed),
+            ctx.send(
+                "**Successfully set up server.**\n"
+                "Consider setting permission levels to give access to roles "
+                "or users the ability to use Modmail.\n\n"
+                f"Type:\n- `{self.bot.prefix}permissions` and `{self.bot.prefix}permissions add` "
+                "for more info on setting permissions.\n"
+                f"- `{self.bot.prefix}config help` for a list of available customizations."
+            ),
         )
 
         if not self.bot.config["command_permissions"] and not self.bot.config["level_permissions"]:
@@ -165,16 +299,39 @@ class Modmail(commands.Cog):
             embed.set_author(name="Snippets", icon_url=ctx.guild.icon_url)
             return await ctx.send(embed=embed)
 
+        if self._snippet_pages_cache is None:
+            names = list(self.bot.snippets)
+            # Sorting and formatting thousands of snippets would block the event loop
+            embeds = await self.bot.loop.run_in_executor(
+                None, self._build_snippet_pages, names, self.bot.main_color, ctx.guild.icon_url
+            )
+            # Don't cache pages that went stale while they were being built
+            if len(names) == len(self.bot.snippets) and all(
+                name in self.bot.snippets for name in names
+            ):
+                self._snippet_pages_cache = embeds
+        else:
+            embeds = self._snippet_pages_cache
+
+        # The paginator adds page numbers to the footers, keep the cached embeds untouched
+        session = EmbedPaginatorSession(ctx, *(embed.copy() for embed in embeds))
+        await session.run()
+
+    @staticmethod
+    def _build_snippet_pages(names, color, icon_url):
+        keys = sorted(names)
         embeds = []
 
-        for i, names in enumerate(zip_longest(*(iter(sorted(self.bot.snippets)),) * 15)):
-            description = format_description(i, names)
-            embed = discord.Embed(color=self.bot.main_color, description=description)
-            embed.set_author(name="Snippets", icon_url=ctx.guild.icon_url)
+        for i in range(0, len(keys), 15):
+            description = format_description(i // 15, keys[i : i + 15])
+            embed = discord.Embed(color=color, description=description)
+            embed.set_author(name="Snippets", icon_url=icon_url)
             embeds.append(embed)
 
-        session = EmbedPaginatorSession(ctx, *embeds)
-        await session.run()
+        return embeds
+
+    def _invalidate_snippet_pages(self):
+        self._snippet_pages_cache = None
 
     @snippet.command(name="raw")
     @checks.has_permissions(PermissionLevel.SUPPORTER)
@@ -235,7 +392,8 @@ class Modmail(commands.Cog):
             return await ctx.send(embed=embed)
 
         self.bot.snippets[name] = value
-        await self.bot.config.update()
+        self._invalidate_snippet_pages()
+        self.bot.config.mark_dirty()
 
         embed = discord.Embed(
             title="Added snippet",
@@ -244,21 +402,82 @@ class Modmail(commands.Cog):
         )
         return await ctx.send(embed=embed)
 
+    @snippet.command(name="bulk")
+    @checks.has_permissions(PermissionLevel.SUPPORTER)
+    async def snippet_bulk(self, ctx, *, snippets: str = None):
+        """
+        Add multiple snippets at once.
+
+        Provide a JSON object of snippet names and their values,
+        either in a code block or as an attached file: ```
+        {prefix}snippet bulk {{"hey": "hello there :)", "bye": "Goodbye!"}}
+        ```
+        Values are cleaned of mentions like in `{prefix}snippet add`.
+        Snippets that already exist, share a name with an alias, have names
+        longer than 120 characters or have empty values are skipped.
+        """
+        if ctx.message.attachments:
+            raw = (await ctx.message.attachments[0].read()).decode("utf-8", errors="replace")
+        elif snippets is not None:
+            raw = cleanup_code(snippets)
+        else:
+            return await ctx.send_help(ctx.command)
+
+        try:
+            data = json.loads(raw)
+        except json.JSONDecodeError as e:
+            raise commands.BadArgument(f"Invalid JSON: {e}.")
+        if not isinstance(data, dict):
+            raise commands.BadArgument("Snippets must be a JSON object of names and values.")
+
+        added = []
+        skipped = []
+        for name, value in data.items():
+            name = str(name).lower()
+            if (
+                not name
+                or not isinstance(value, str)
+                or not value.strip()
+                or name in self.bot.snippets
+                or name in self.bot.aliases
+                or len(name) > 120
+            ):
+                skipped.append(name)
+                continue
+            self.bot.snippets[name] = await commands.clean_content().convert(ctx, value)
+            added.append(name)
+
+        if added:
+            self._invalidate_snippet_pages()
+            await self.bot.config.update()
+
+        embed = discord.Embed(
+            title="Added snippets",
+            color=self.bot.main_color if added else self.bot.error_color,
+            description=f"Successfully created {len(added)} snippet(s).",
+        )
+        if skipped:
+            embed.add_field(
+                name=f"Skipped ({len(skipped)})",
+                value=truncate(", ".join(f"`{name}`" for name in skipped), 1024),
+            )
+        return await ctx.send(embed=embed)
+
     @snippet.command(name="remove", aliases=["del", "delete"])
     @checks.has_permissions(PermissionLevel.SUPPORTER)
     async def snippet_remove(self, ctx, *, name: str.lower):
         """Remove a snippet."""
 
-        if name in self.bot.snippets:
+        if self.bot.snippets.pop(name, None) is None:
+            embed = create_not_found_embed(name, self.bot.snippets.keys(), "Snippet")
+        else:
             embed = discord.Embed(
                 title="Removed snippet",
                 color=self.bot.main_color,
                 description=f"Snippet `{name}` is now deleted.",
             )
-            self.bot.snippets.pop(name)
-            await self.bot.config.update()
-        else:
-            embed = create_not_found_embed(name, self.bot.snippets.keys(), "Snippet")
+            self._invalidate_snippet_pages()
+            self.bot.config.mark_dirty()
         await ctx.send(embed=embed)
 
     @snippet.command(name="edit")
@@ -273,7 +492,7 @@ class Modmail(commands.Cog):
         """
         if name in self.bot.snippets:
             self.bot.snippets[name] = value
-            await self.bot.config.update()
+            self.bot.config.mark_dirty()
 
             embed = discord.Embed(
                 title="Edited snippet",
@@ -301,7 +520,19 @@ class Modmail(commands.Cog):
             silent_words = ["silent", "silently"]
             silent = any(word in silent_words for word in specifics.split())
 
-        await thread.channel.edit(category=category, sync_permissions=True)
+        async with self._rate_limit("channel_edit"):
+            await thread.channel.edit(category=category, sync_permissions=True)
+
+        # The recipient is only told once the move has actually happened
+        async def notify_recipient(embed):
+            async with self._rate_limit("recipient_send"):
+                await thread.recipient.send(embed=embed)
+
+        async def add_reaction():
+            async with self._rate_limit("add_reaction"):
+                await self._add_sent_reaction(ctx.message)
+
+        tasks = [add_reaction()]
 
         if self.bot.config["thread_move_notify"] and not silent:
             embed = discord.Embed(
@@ -309,10 +540,9 @@ class Modmail(commands.Cog):
                 description=self.bot.config["thread_move_response"],
                 color=self.bot.main_color,
             )
-            await thread.recipient.send(embed=embed)
+            tasks.append(notify_recipient(embed))
 
-        sent_emoji, _ = await self.bot.retrieve_emoji()
-        await self.bot.add_reaction(ctx.message, sent_emoji)
+        await asyncio.gather(*tasks)
 
     async def send_scheduled_close_message(self, ctx, after, silent=False):
         human_delta = human_timedelta(after.dt)
@@ -331,7 +561,8 @@ class Modmail(commands.Cog):
         embed.set_footer(text="Closing will be cancelled if a thread message is sent.")
         embed.timestamp = after.dt
 
-        await ctx.send(embed=embed)
+        async with self._rate_limit("channel_send"):
+            await ctx.send(embed=embed)
 
     @commands.command(usage="[after] [close message]")
     @checks.has_permissions(PermissionLevel.SUPPORTER)
@@ -385,16 +616,35 @@ class Modmail(commands.Cog):
 
         await thread.close(closer=ctx.author, after=close_after, message=message, silent=silent)
 
+    def _get_mentions(self, kind: str, thread_id: int) -> set:
+        """
+        Retrieves the pending mention keys of a thread from `kind` config as a set,
+        converting the stored list on first access.
+        """
+        table = self.bot.config[kind]
+        tid = str(thread_id)
+        mentions = table.setdefault(tid, set())
+        if not isinstance(mentions, set):
+            mentions = table[tid] = set(map(mention_to_key, mentions))
+        return mentions
+
     @staticmethod
     def parse_user_or_role(ctx, user_or_role):
-        mention = None
+        """
+        Returns a `(key, mention)` tuple for `user_or_role`,
+        or `None` if it isn't a valid user or role.
+        """
         if user_or_role is None:
-            mention = ctx.author.mention
-        elif hasattr(user_or_role, "mention"):
-            mention = user_or_role.mention
-        elif user_or_role in {"here", "everyone", "@here", "@everyone"}:
-            mention = "@" + user_or_role.lstrip("@")
-        return mention
+            return f"user:{ctx.author.id}", ctx.author.mention
+        if isinstance(user_or_role, discord.Role):
+            return f"role:{user_or_role.id}", user_or_role.mention
+        mention = getattr(user_or_role, "mention", None)
+        if mention:
+            return f"user:{user_or_role.id}", mention
+        if isinstance(user_or_role, str) and user_or_role in MENTION_KEYWORDS:
+            key = user_or_role.lstrip("@")
+            return key, "@" + key
+        return None
 
     @commands.command(aliases=["alert"])
     @checks.has_permissions(PermissionLevel.SUPPORTER)
@@ -411,25 +661,23 @@ class Modmail(commands.Cog):
         `@here` and `@everyone` can be substituted with `here` and `everyone`.
         `user_or_role` may be a user ID, mention, name. role ID, mention, name, "everyone", or "here".
         """
-        mention = self.parse_user_or_role(ctx, user_or_role)
-        if mention is None:
+        parsed = self.parse_user_or_role(ctx, user_or_role)
+        if parsed is None:
             raise commands.BadArgument(f"{user_or_role} is not a valid user or role.")
+        key, mention = parsed
 
         thread = ctx.thread
 
-        if str(thread.id) not in self.bot.config["notification_squad"]:
-            self.bot.config["notification_squad"][str(thread.id)] = []
+        mentions = self._get_mentions("notification_squad", thread.id)
 
-        mentions = self.bot.config["notification_squad"][str(thread.id)]
-
-        if mention in mentions:
+        if key in mentions:
             embed = discord.Embed(
                 color=self.bot.error_color,
                 description=f"{mention} is already going to be mentioned.",
             )
         else:
-            mentions.append(mention)
-            await self.bot.config.update()
+            mentions.add(key)
+            self.bot.config.mark_dirty()
             embed = discord.Embed(
                 color=self.bot.main_color,
                 description=f"{mention} will be mentioned on the next message received.",
@@ -449,25 +697,24 @@ class Modmail(commands.Cog):
         `@here` and `@everyone` can be substituted with `here` and `everyone`.
         `user_or_role` may be a user ID, mention, name, role ID, mention, name, "everyone", or "here".
         """
-        mention = self.parse_user_or_role(ctx, user_or_role)
-        if mention is None:
-            mention = f"`{user_or_role}`"
+        parsed = self.parse_user_or_role(ctx, user_or_role)
+        if parsed is None:
+            key = mention = f"`{user_or_role}`"
+        else:
+            key, mention = parsed
 
         thread = ctx.thread
 
-        if str(thread.id) not in self.bot.config["notification_squad"]:
-            self.bot.config["notification_squad"][str(thread.id)] = []
-
-        mentions = self.bot.config["notification_squad"][str(thread.id)]
+        mentions = self._get_mentions("notification_squad", thread.id)
 
-        if mention not in mentions:
+        if key not in mentions:
             embed = discord.Embed(
                 color=self.bot.error_color,
                 description=f"{mention} does not have a pending notification.",
             )
         else:
-            mentions.remove(mention)
-            await self.bot.config.update()
+            mentions.discard(key)
+            self.bot.config.mark_dirty()
             embed = discord.Embed(
                 color=self.bot.main_color, description=f"{mention} will no longer be notified."
             )
@@ -488,25 +735,23 @@ class Modmail(commands.Cog):
         `@here` and `@everyone` can be substituted with `here` and `everyone`.
         `user_or_role` may be a user ID, mention, name, role ID, mention, name, "everyone", or "here".
         """
-        mention = self.parse_user_or_role(ctx, user_or_role)
-        if mention is None:
+        parsed = self.parse_user_or_role(ctx, user_or_role)
+        if parsed is None:
             raise commands.BadArgument(f"{user_or_role} is not a valid user or role.")
+        key, mention = parsed
 
         thread = ctx.thread
 
-        if str(thread.id) not in self.bot.config["subscriptions"]:
-            self.bot.config["subscriptions"][str(thread.id)] = []
+        mentions = self._get_mentions("subscriptions", thread.id)
 
-        mentions = self.bot.config["subscriptions"][str(thread.id)]
-
-        if mention in mentions:
+        if key in mentions:
             embed = discord.Embed(
                 color=self.bot.error_color,
                 description=f"{mention} is not subscribed to this thread.",
             )
         else:
-            mentions.append(mention)
-            await self.bot.config.update()
+            mentions.add(key)
+            self.bot.config.mark_dirty()
             embed = discord.Embed(
                 color=self.bot.main_color,
                 description=f"{mention} will now be notified of all messages received.",
@@ -526,25 +771,24 @@ class Modmail(commands.Cog):
         `@here` and `@everyone` can be substituted with `here` and `everyone`.
         `user_or_role` may be a user ID, mention, name, role ID, mention, name, "everyone", or "here".
         """
-        mention = self.parse_user_or_role(ctx, user_or_role)
-        if mention is None:
-            mention = f"`{user_or_role}`"
+        parsed = self.parse_user_or_role(ctx, user_or_role)
+        if parsed is None:
+            key = mention = f"`{user_or_role}`"
+        else:
+            key, mention = parsed
 
         thread = ctx.thread
 
-        if str(thread.id) not in self.bot.config["subscriptions"]:
-            self.bot.config["subscriptions"][str(thread.id)] = []
-
-        mentions = self.bot.config["subscriptions"][str(thread.id)]
+        mentions = self._get_mentions("subscriptions", thread.id)
 
-        if mention not in mentions:
+        if key not in mentions:
             embed = discord.Embed(
                 color=self.bot.error_color,
                 description=f"{mention} is not already subscribed to this thread.",
             )
         else:
-            mentions.remove(mention)
-            await self.bot.config.update()
+            mentions.discard(key)
+            self.bot.config.mark_dirty()
             embed = discord.Embed(
                 color=self.bot.main_color,
                 description=f"{mention} is now unsubscribed from this thread.",
@@ -556,18 +800,20 @@ class Modmail(commands.Cog):
     @checks.thread_only()
     async def nsfw(self, ctx):
         """Flags a Modmail thread as NSFW (not safe for work)."""
-        await ctx.channel.edit(nsfw=True)
-        sent_emoji, _ = await self.bot.retrieve_emoji()
-        await self.bot.add_reaction(ctx.message, sent_emoji)
+        async with self._rate_limit("channel_edit"):
+            await ctx.channel.edit(nsfw=True)
+        async with self._rate_limit("add_reaction"):
+            await self._add_sent_reaction(ctx.message)
 
     @commands.command()
     @checks.has_permissions(PermissionLevel.SUPPORTER)
     @checks.thread_only()
     async def sfw(self, ctx):
         """Flags a Modmail thread as SFW (safe for work)."""
-        await ctx.channel.edit(nsfw=False)
-        sent_emoji, _ = await self.bot.retrieve_emoji()
-        await self.bot.add_reaction(ctx.message, sent_emoji)
+        async with self._rate_limit("channel_edit"):
+            await ctx.channel.edit(nsfw=False)
+        async with self._rate_limit("add_reaction"):
+            await self._add_sent_reaction(ctx.message)
 
     @commands.command()
     @checks.has_permissions(PermissionLevel.SUPPORTER)
@@ -578,47 +824,74 @@ class Modmail(commands.Cog):
         await ctx.send(embed=discord.Embed(color=self.bot.main_color, description=log_link))
 
     def format_log_embeds(self, logs, avatar_url):
-        embeds = []
-        logs = tuple(logs)
-        title = f"Total Results Found ({len(logs)})"
-
-        for entry in logs:
-            created_at = parser.parse(entry["created_at"])
-
-            prefix = self.bot.config["log_url_prefix"].strip("/")
-            if prefix == "NONE":
-                prefix = ""
-            log_url = f"{self.bot.config['log_url'].strip('/')}{'/' + prefix if prefix else ''}/{entry['key']}"
-
-            username = entry["recipient"]["name"] + "#"
-            username += entry["recipient"]["discriminator"]
-
-            embed = discord.Embed(color=self.bot.main_color, timestamp=created_at)
-            embed.set_author(name=f"{title} - {username}", icon_url=avatar_url, url=log_url)
-            embed.url = log_url
-            embed.add_field(name="Created", value=duration(created_at, now=datetime.utcnow()))
-            closer = entry.get("closer")
-            if closer is None:
-                closer_msg = "Unknown"
-            else:
-                closer_msg = f"<@{closer['id']}>"
-            embed.add_field(name="Closed By", value=closer_msg)
+        base_url, color, now = self._log_url_base(), self.bot.main_color, datetime.utcnow()
+        embeds = [
+            self._format_log_embed(entry, avatar_url, base_url, color, now) for entry in logs
+        ]
+        return self._set_log_embed_titles(embeds)
 
-            if entry["recipient"]["id"] != entry["creator"]["id"]:
-                embed.add_field(name="Created by", value=f"<@{entry['creator']['id']}>")
+    async def format_log_cursor(self, cursor, avatar_url):
+        """
+        Same as `format_log_embeds`, but builds the embeds from a database
+        cursor as the entries arrive instead of loading them all first.
+        """
+        base_url, color, now = self._log_url_base(), self.bot.main_color, datetime.utcnow()
+        embeds = [
+            self._format_log_embed(entry, avatar_url, base_url, color, now)
+            async for entry in cursor
+        ]
+        return self._set_log_embed_titles(embeds)
 
-            embed.add_field(name="Preview", value=format_preview(entry["messages"]), inline=False)
+    @staticmethod
+    def _set_log_embed_titles(embeds):
+        title = f"Total Results Found ({len(embeds)})"
+        for embed in embeds:
+            embed.set_author(
+                name=f"{title} - {embed.author.name}",
+                icon_url=embed.author.icon_url,
+                url=embed.author.url,
+            )
+        return embeds
 
-            if closer is not None:
-                # BUG: Currently, logviewer can't display logs without a closer.
-                embed.add_field(name="Link", value=log_url)
-            else:
-                logger.debug("Invalid log entry: no closer.")
-                embed.add_field(name="Log Key", value=f"`{entry['key']}`")
+    def _log_url_base(self) -> str:
+        prefix = self.bot.config["log_url_prefix"].strip("/")
+        if prefix == "NONE":
+            prefix = ""
+        return f"{self.bot.config['log_url'].strip('/')}{'/' + prefix if prefix else ''}"
 
-            embed.set_footer(text="Recipient ID: " + str(entry["recipient"]["id"]))
-            embeds.append(embed)
-        return embeds
+    @staticmethod
+    def _format_log_embed(entry, avatar_url, base_url, color, now):
+        created_at = _parse_timestamp(entry["created_at"])
+        log_url = f"{base_url}/{entry['key']}"
+
+        username = entry["recipient"]["name"] + "#"
+        username += entry["recipient"]["discriminator"]
+
+        embed = discord.Embed(color=color, timestamp=created_at)
+        embed.set_author(name=username, icon_url=avatar_url, url=log_url)
+        embed.url = log_url
+        embed.add_field(name="Created", value=duration(created_at, now=now))
+        closer = entry.get("closer")
+        if closer is None:
+            closer_msg = "Unknown"
+        else:
+            closer_msg = f"<@{closer['id']}>"
+        embed.add_field(name="Closed By", value=closer_msg)
+
+        if entry["recipient"]["id"] != entry["creator"]["id"]:
+            embed.add_field(name="Created by", value=f"<@{entry['creator']['id']}>")
+
+        embed.add_field(name="Preview", value=format_preview(entry["messages"]), inline=False)
+
+        if closer is not None:
+            # BUG: Currently, logviewer can't display logs without a closer.
+            embed.add_field(name="Link", value=log_url)
+        else:
+            logger.debug("Invalid log entry: no closer.")
+            embed.add_field(name="Log Key", value=f"`{entry['key']}`")
+
+        embed.set_footer(text="Recipient ID: " + str(entry["recipient"]["id"]))
+        return embed
 
     @commands.group(invoke_without_command=True)
     @checks.has_permissions(PermissionLevel.SUPPORTER)
@@ -642,16 +915,14 @@ class Modmail(commands.Cog):
         default_avatar = "https://cdn.discordapp.com/embed/avatars/0.png"
         icon_url = getattr(user, "avatar_url", default_avatar)
 
-        logs = await self.bot.api.get_user_logs(user.id)
-
-        if not any(not log["open"] for log in logs):
+        if not await self.bot.api.has_closed_logs(user.id):
             embed = discord.Embed(
                 color=self.bot.error_color,
                 description="This user does not have any previous logs.",
             )
             return await ctx.send(embed=embed)
 
-        logs = reversed([log for log in logs if not log["open"]])
+        logs = await self.bot.api.get_user_logs(user.id, open_=False, sort_desc=True)
 
         embeds = self.format_log_embeds(logs, avatar_url=icon_url)
 
@@ -662,7 +933,7 @@ class Modmail(commands.Cog):
     @checks.has_permissions(PermissionLevel.SUPPORTER)
     async def logs_closed_by(self, ctx, *, user: User = None):
         """
-        Get all logs closed by the specified user.
+        Get logs closed by the specified user, up to 100 entries.
 
         If no `user` is provided, the user will be the person who sent this command.
         `user` may be a user ID, mention, or name.
@@ -671,11 +942,9 @@ class Modmail(commands.Cog):
 
         query = {"guild_id": str(self.bot.guild_id), "open": False, "closer.id": str(user.id)}
 
-        projection = {"messages": {"$slice": 5}}
+        cursor = self.bot.db.logs.find(query, LOG_EMBED_PROJECTION).limit(100)
 
-        entries = await self.bot.db.logs.find(query, projection).to_list(None)
-
-        embeds = self.format_log_embeds(entries, avatar_url=self.bot.guild.icon_url)
+        embeds = await self.format_log_cursor(cursor, avatar_url=self.bot.guild.icon_url)
 
         if not embeds:
             embed = discord.Embed(
@@ -754,11 +1023,11 @@ class Modmail(commands.Cog):
             "$text": {"$search": f'"{query}"'},
         }
 
-        projection = {"messages": {"$slice": 5}}
+        cursor = self.bot.db.logs.find(query, LOG_EMBED_PROJECTION)
+        if limit:
+            cursor = cursor.limit(limit)
 
-        entries = await self.bot.db.logs.find(query, projection).to_list(limit)
-
-        embeds = self.format_log_embeds(entries, avatar_url=self.bot.guild.icon_url)
+        embeds = await self.format_log_cursor(cursor, avatar_url=self.bot.guild.icon_url)
 
         if not embeds:
             embed = discord.Embed(
@@ -835,7 +1104,7 @@ class Modmail(commands.Cog):
         ctx.message.content = msg
         async with ctx.typing():
             msg = await ctx.thread.note(ctx.message)
-            await msg.pin()
+        self.bot.loop.create_task(self._safe_pin(msg))
 
     @commands.command()
     @checks.has_permissions(PermissionLevel.SUPPORTER)
@@ -862,8 +1131,7 @@ class Modmail(commands.Cog):
                 )
             )
 
-        sent_emoji, _ = await self.bot.retrieve_emoji()
-        await self.bot.add_reaction(ctx.message, sent_emoji)
+        self.bot.loop.create_task(self._add_sent_reaction(ctx.message))
 
     @commands.command()
     @checks.has_permissions(PermissionLevel.SUPPORTER)
@@ -911,10 +1179,30 @@ class Modmail(commands.Cog):
             )
             await thread.wait_until_ready()
             await thread.channel.send(embed=embed)
-            sent_emoji, _ = await self.bot.retrieve_emoji()
-            await self.bot.add_reaction(ctx.message, sent_emoji)
-            await asyncio.sleep(3)
-            await ctx.message.delete()
+            self.bot.loop.create_task(self._contact_cleanup(ctx.message))
+
+    async def _contact_cleanup(self, message):
+        await self._add_sent_reaction(message)
+        await asyncio.sleep(3)
+        try:
+            await message.delete()
+        except discord.NotFound:
+            pass
+        except discord.HTTPException:
+            # Most likely missing the Manage Messages permission
+            logger.warning("Failed to delete message %s.", message.id, exc_info=True)
+
+    def _escaped_name(self, user) -> str:
+        """`escape_markdown` of the user's name, cached per ID and name."""
+        key = (user.id, user.name)
+        name = self._escaped_name_cache.get(key)
+        if name is None:
+            name = self._escaped_name_cache[key] = escape_markdown(user.name)
+            if len(self._escaped_name_cache) > 1024:
+                self._escaped_name_cache.popitem(last=False)
+        else:
+            self._escaped_name_cache.move_to_end(key)
+        return name
 
     @commands.group(invoke_without_command=True)
     @checks.has_permissions(PermissionLevel.MODERATOR)
@@ -922,36 +1210,44 @@ class Modmail(commands.Cog):
     async def blocked(self, ctx):
         """Retrieve a list of blocked users."""
 
-        embeds = [discord.Embed(title="Blocked Users", color=self.bot.main_color, description="")]
-
         users = []
+        semaphore = asyncio.Semaphore(10)
 
-        for id_, reason in self.bot.blocked_users.items():
-            user = self.bot.get_user(int(id_))
-            if user:
-                users.append((user.mention, reason))
+        async def resolve(id_):
+            async with semaphore:
+                return await self._fetch_user(int(id_))
+
+        blocked = list(self.bot.blocked_users.items())
+        results = await asyncio.gather(
+            *(resolve(id_) for id_, _ in blocked), return_exceptions=True
+        )
+
+        for (id_, reason), user in zip(blocked, results):
+            if user is None or isinstance(user, Exception):
+                users.append((id_, reason))
             else:
-                try:
-                    user = await self.bot.fetch_user(id_)
-                    users.append((user.mention, reason))
-                except discord.NotFound:
-                    users.append((id_, reason))
-
-        if users:
-            embed = embeds[0]
-
-            for mention, reason in users:
-                line = mention + f" - {reason or 'No Reason Provided'}\n"
-                if len(embed.description) + len(line) > 2048:
-                    embed = discord.Embed(
-                        title="Blocked Users (Continued)",
-                        color=self.bot.main_color,
-                        description=line,
-                    )
-                    embeds.append(embed)
-                else:
-                    embed.description += line
-        else:
+                users.append((user.mention, reason))
+
+        # Collect the lines of each page and join them once
+        pages = [[]]
+        length = 0
+        for mention, reason in users:
+            line = mention + f" - {reason or 'No Reason Provided'}\n"
+            if length + len(line) > 2048:
+                pages.append([])
+                length = 0
+            pages[-1].append(line)
+            length += len(line)
+
+        embeds = [
+            discord.Embed(
+                title="Blocked Users (Continued)" if i else "Blocked Users",
+                color=self.bot.main_color,
+                description="".join(lines),
+            )
+            for i, lines in enumerate(pages)
+        ]
+        if pages == [[]]:
             embeds[0].description = "Currently there are no blocked users."
 
         session = EmbedPaginatorSession(ctx, *embeds)
@@ -973,25 +1269,23 @@ class Modmail(commands.Cog):
             else:
                 return await ctx.send_help(ctx.command)
 
-        mention = getattr(user, "mention", f"`{user.id}`")
-        msg = ""
+        uid = str(user.id)
+        mention = _mention(user)
 
-        if str(user.id) in self.bot.blocked_whitelisted_users:
+        if uid in self.bot.blocked_whitelisted_users:
             embed = discord.Embed(
                 title="Success",
                 description=f"{mention} is no longer whitelisted.",
                 color=self.bot.main_color,
             )
-            self.bot.blocked_whitelisted_users.remove(str(user.id))
+            self.bot.blocked_whitelisted_users.remove(uid)
+            self.bot.config.mark_dirty()
             return await ctx.send(embed=embed)
 
-        self.bot.blocked_whitelisted_users.append(str(user.id))
-
-        if str(user.id) in self.bot.blocked_users:
-            msg = self.bot.blocked_users.get(str(user.id)) or ""
-            self.bot.blocked_users.pop(str(user.id))
+        self.bot.blocked_whitelisted_users.add(uid)
+        msg = self.bot.blocked_users.pop(uid, None) or ""
 
-        await self.bot.config.update()
+        self.bot.config.mark_dirty()
 
         if msg.startswith("System Message: "):
             # If the user is blocked internally (for example: below minimum account age)
@@ -1036,9 +1330,10 @@ class Modmail(commands.Cog):
             else:
                 raise commands.BadArgument(f'User "{after.arg}" not found.')
 
-        mention = getattr(user, "mention", f"`{user.id}`")
+        uid = str(user.id)
+        mention = _mention(user)
 
-        if str(user.id) in self.bot.blocked_whitelisted_users:
+        if uid in self.bot.blocked_whitelisted_users:
             embed = discord.Embed(
                 title="Error",
                 description=f"Cannot block {mention}, user is whitelisted.",
@@ -1046,23 +1341,22 @@ class Modmail(commands.Cog):
             )
             return await ctx.send(embed=embed)
 
-        reason = f"by {escape_markdown(ctx.author.name)}#{ctx.author.discriminator}"
+        author = f"{self._escaped_name(ctx.author)}#{ctx.author.discriminator}"
+        details = ""
 
         if after is not None:
-            if "%" in reason:
+            if "%" in author:
                 raise commands.BadArgument('The reason contains illegal character "%".')
             if after.arg:
-                reason += f" for `{after.arg}`"
+                details += f" for `{after.arg}`"
             if after.dt > after.now:
-                reason += f" until {after.dt.isoformat()}"
+                details += f" until {after.dt.isoformat()}"
 
-        reason += "."
+        reason = f"by {author}{details}."
 
-        msg = self.bot.blocked_users.get(str(user.id))
-        if msg is None:
-            msg = ""
+        msg = self.bot.blocked_users.get(uid) or ""
 
-        if str(user.id) in self.bot.blocked_users and msg:
+        if msg:
             old_reason = msg.strip().rstrip(".")
             embed = discord.Embed(
                 title="Success",
@@ -1076,8 +1370,8 @@ class Modmail(commands.Cog):
                 color=self.bot.main_color,
                 description=f"{mention} is now blocked {reason}",
             )
-        self.bot.blocked_users[str(user.id)] = reason
-        await self.bot.config.update()
+        self.bot.blocked_users[uid] = reason
+        self.bot.config.mark_dirty()
 
         return await ctx.send(embed=embed)
 
@@ -1100,12 +1394,13 @@ class Modmail(commands.Cog):
             else:
                 raise commands.MissingRequiredArgument(SimpleNamespace(name="user"))
 
-        mention = getattr(user, "mention", f"`{user.id}`")
-        name = getattr(user, "name", f"`{user.id}`")
+        uid = str(user.id)
+        mention = _mention(user)
+        name = _name(user)
 
-        if str(user.id) in self.bot.blocked_users:
-            msg = self.bot.blocked_users.pop(str(user.id)) or ""
-            await self.bot.config.update()
+        if uid in self.bot.blocked_users:
+            msg = self.bot.blocked_users.pop(uid) or ""
+            self.bot.config.mark_dirty()
 
             if msg.startswith("System Message: "):
                 # If the user is blocked internally (for example: below minimum account age)
@@ -1161,8 +1456,7 @@ class Modmail(commands.Cog):
                 )
             )
 
-        sent_emoji, _ = await self.bot.retrieve_emoji()
-        await self.bot.add_reaction(ctx.message, sent_emoji)
+        self.bot.loop.create_task(self._add_sent_reaction(ctx.message))
 
     @commands.command()
     @checks.has_permissions(PermissionLevel.SUPPORTER)
@@ -1170,7 +1464,7 @@ class Modmail(commands.Cog):
         """
         Repair a thread broken by Discord.
         """
-        sent_emoji, blocked_emoji = await self.bot.retrieve_emoji()
+        sent_emoji, blocked_emoji = await self._get_emojis()
 
         if ctx.thread:
             user_id = match_user_id(ctx.channel.topic)
@@ -1252,10 +1546,8 @@ class Modmail(commands.Cog):
                         embed.set_footer(
                             text='Please manually delete this channel, do not use "{prefix}close".'
                         )
-                        try:
+                        with suppress(discord.HTTPException):
                             await thread.channel.send(embed=embed)
-                        except discord.HTTPException:
-                            pass
                 if recipient is None:
                     self.bot.threads.cache[user.id] = thread = Thread(
                         self.bot.threads, user_id, ctx.channel
@@ -1275,6 +1567,54 @@ class Modmail(commands.Cog):
                 logger.info("Multiple users with the same name and discriminator.")
         return await self.bot.add_reaction(ctx.message, blocked_emoji)
 
+    def _dm_embed(self, name: str) -> discord.Embed:
+        """
+        Retrieves a response embed of the enable, disable and isenable commands,
+        built once and cached until the colour configs change.
+        The embed is shared, so it must be sent as is and never edited.
+        """
+        if self._dm_embeds is None:
+            self._dm_embeds = {
+                "enable": discord.Embed(
+                    title="Success",
+                    description="Modmail will now accept all DM messages.",
+                    color=self.bot.main_color,
+                ),
+                "disable_new": discord.Embed(
+                    title="Success",
+                    description="Modmail will not create any new threads.",
+                    color=self.bot.main_color,
+                ),
+                "disable_all": discord.Embed(
+                    title="Success",
+                    description="Modmail will not accept any DM messages.",
+                    color=self.bot.main_color,
+                ),
+                "status_new_disabled": discord.Embed(
+                    title="New Threads Disabled",
+                    description="Modmail is not creating new threads.",
+                    color=self.bot.error_color,
+                ),
+                "status_all_disabled": discord.Embed(
+                    title="All DM Disabled",
+                    description="Modmail is not accepting any DM messages "
+                    "for new and existing threads.",
+                    color=self.bot.error_color,
+                ),
+                "status_enabled": discord.Embed(
+                    title="Enabled",
+                    description="Modmail is accepting all DM messages.",
+                    color=self.bot.main_color,
+                ),
+            }
+        return self._dm_embeds[name]
+
+    def _set_dm_disabled(self, level: int) -> None:
+        """Sets `dm_disabled`, only scheduling a config write if it changed."""
+        if self.bot.config["dm_disabled"] != level:
+            self.bot.config["dm_disabled"] = level
+            self.bot.config.mark_dirty()
+
     @commands.command()
     @checks.has_permissions(PermissionLevel.ADMINISTRATOR)
     async def enable(self, ctx):
@@ -1283,15 +1623,9 @@ class Modmail(commands.Cog):
 
         Undo's the `{prefix}disable` command, all DM will be relayed after running this command.
         """
-        embed = discord.Embed(
-            title="Success",
-            description="Modmail will now accept all DM messages.",
-            color=self.bot.main_color,
-        )
+        embed = self._dm_embed("enable")
 
-        if self.bot.config["dm_disabled"] != 0:
-            self.bot.config["dm_disabled"] = 0
-            await self.bot.config.update()
+        self._set_dm_disabled(0)
 
         return await ctx.send(embed=embed)
 
@@ -1315,14 +1649,9 @@ class Modmail(commands.Cog):
 
         No new threads can be created through DM.
         """
-        embed = discord.Embed(
-            title="Success",
-            description="Modmail will not create any new threads.",
-            color=self.bot.main_color,
-        )
+        embed = self._dm_embed("disable_new")
         if self.bot.config["dm_disabled"] < 1:
-            self.bot.config["dm_disabled"] = 1
-            await self.bot.config.update()
+            self._set_dm_disabled(1)
 
         return await ctx.send(embed=embed)
 
@@ -1334,15 +1663,9 @@ class Modmail(commands.Cog):
 
         No new threads can be created through DM nor no further DM messages will be relayed.
         """
-        embed = discord.Embed(
-            title="Success",
-            description="Modmail will not accept any DM messages.",
-            color=self.bot.main_color,
-        )
+        embed = self._dm_embed("disable_all")
 
-        if self.bot.config["dm_disabled"] != 2:
-            self.bot.config["dm_disabled"] = 2
-            await self.bot.config.update()
+        self._set_dm_disabled(2)
 
         return await ctx.send(embed=embed)
 
@@ -1354,23 +1677,11 @@ class Modmail(commands.Cog):
         """
 
         if self.bot.config["dm_disabled"] == 1:
-            embed = discord.Embed(
-                title="New Threads Disabled",
-                description="Modmail is not creating new threads.",
-                color=self.bot.error_color,
-            )
+            embed = self._dm_embed("status_new_disabled")
         elif self.bot.config["dm_disabled"] == 2:
-            embed = discord.Embed(
-                title="All DM Disabled",
-                description="Modmail is not accepting any DM messages for new and existing threads.",
-                color=self.bot.error_color,
-            )
+            embed = self._dm_embed("status_all_disabled")
         else:
-            embed = discord.Embed(
-                title="Enabled",
-                description="Modmail is accepting all DM messages.",
-                color=self.bot.main_color,
-            )
+            embed = self._dm_embed("status_enabled")
 
         return await ctx.send(embed=embed)
 
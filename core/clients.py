@@ -84,12 +84,23 @@ class ApiClient(RequestClient):
     def logs(self):
         return self.db.logs
 
-    async def get_user_logs(self, user_id: Union[str, int]) -> list:
+    async def get_user_logs(
+        self, user_id: Union[str, int], *, open_: bool = None, sort_desc: bool = False
+    ) -> list:
         query = {"recipient.id": str(user_id), "guild_id": str(self.bot.guild_id)}
+        if open_ is not None:
+            query["open"] = open_
         projection = {"messages": {"$slice": 5}}
         logger.debug("Retrieving user %s logs.", user_id)
 
-        return await self.logs.find(query, projection).to_list(None)
+        cursor = self.logs.find(query, projection)
+        if sort_desc:
+            cursor = cursor.sort("created_at", -1)
+        return await cursor.to_list(None)
+
+    async def has_closed_logs(self, user_id: Union[str, int]) -> bool:
+        query = {"recipient.id": str(user_id), "guild_id": str(self.bot.guild_id), "open": False}
+        return await self.logs.count_documents(query, limit=1) > 0
 
     async def get_latest_user_logs(self, user_id: Union[str, int]):
         query = {"recipient.id": str(user_id), "guild_id": str(self.bot.guild_id), "open": False}
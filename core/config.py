@@ -14,12 +14,21 @@ from discord.ext.commands import BadArgument
 from core._color_data import ALL_COLORS
 from core.models import InvalidConfigError, Default, getLogger
 from core.time import UserFriendlyTimeSync
-from core.utils import strtobool
+from core.utils import strtobool, mention_to_key
 
 logger = getLogger(__name__)
 load_dotenv()
 
 
+def _serializable(value: typing.Any) -> typing.Any:
+    """Converts the in-memory sets used by the cache back into storable lists."""
+    if isinstance(value, set):
+        return sorted(value)
+    if isinstance(value, dict):
+        return {k: _serializable(v) for k, v in value.items()}
+    return value
+
+
 class ConfigManager:
 
     public_keys = {
@@ -140,6 +149,9 @@ class ConfigManager:
         self._cache = {}
         self.ready_event = asyncio.Event()
         self.config_help = {}
+        self._flush_task = None
+        self._last_update = None
+        self._update_lock = asyncio.Lock()
 
     def __repr__(self):
         return repr(self._cache)
@@ -167,6 +179,8 @@ class ConfigManager:
                 except json.JSONDecodeError:
                     logger.critical("Failed to load config.json env values.", exc_info=True)
         self._cache = data
+        self._ensure_mappings()
+        self._migrate_mentions()
 
         config_help_json = os.path.join(
             os.path.dirname(os.path.abspath(__file__)), "config_help.json"
@@ -178,7 +192,39 @@ class ConfigManager:
 
     async def update(self):
         """Updates the config with data from the cache"""
-        await self.bot.api.update_config(self.filter_default(self._cache))
+        # One write at a time, so an older snapshot never lands after a newer one
+        async with self._update_lock:
+            data = self.filter_default(_serializable(self._cache))
+            if data == self._last_update:
+                # Nothing changed since the last write, such as a DM from an unblocked user
+                return
+            await self.bot.api.update_config(data)
+            self._last_update = deepcopy(data)
+
+    def mark_dirty(self, delay: float = 0.5) -> None:
+        """
+        Schedules an `update`, coalescing every change made
+        within `delay` seconds into a single database write.
+        """
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = self.bot.loop.create_task(self._flush_after(delay))
+
+    async def _flush_after(self, delay: float) -> None:
+        await asyncio.sleep(delay)
+        self._flush_task = None
+        await self.update()
+
+    async def flush(self) -> None:
+        """
+        Immediately writes any pending changes scheduled by `mark_dirty`,
+        waiting for a write that is already running to finish first.
+        """
+        task = self._flush_task
+        if task is not None and not task.done():
+            # Still waiting out the delay, `_flush_after` clears it once writing
+            task.cancel()
+            self._flush_task = None
+        await self.update()
 
     async def refresh(self) -> dict:
         """Refreshes internal cache with data from database"""
@@ -186,11 +232,46 @@ class ConfigManager:
             k = k.lower()
             if k in self.all_keys:
                 self._cache[k] = v
+        self._last_update = None
+        self._ensure_mappings()
+        self._migrate_mentions()
         if not self.ready_event.is_set():
             self.ready_event.set()
             logger.debug("Successfully fetched configurations from database.")
         return self._cache
 
+    def _ensure_mappings(self) -> None:
+        """
+        Makes sure mapping configs, such as snippets and aliases, are dicts,
+        so lookups on them are never linear scans.
+        """
+        for key, default in self.defaults.items():
+            if not isinstance(default, dict) or key not in self._cache:
+                continue
+            value = self._cache[key]
+            if isinstance(value, dict):
+                continue
+            # Only a list of [key, value] pairs is a mapping stored as a list
+            if isinstance(value, (list, tuple)) and all(
+                isinstance(pair, (list, tuple)) and len(pair) == 2 for pair in value
+            ):
+                self._cache[key] = dict(value)
+            else:
+                logger.warning("Invalid %s configuration, resetting to default.", key)
+                self.remove(key)
+
+    def _migrate_mentions(self) -> None:
+        """
+        Converts the mention strings stored by older versions in
+        notification and subscription configs into normalized keys.
+        """
+        for key in ("notification_squad", "subscriptions"):
+            table = self._cache.get(key)
+            if not table:
+                continue
+            for thread_id, mentions in table.items():
+                table[thread_id] = set(map(mention_to_key, mentions))
+
     async def wait_until_ready(self) -> None:
         await self.ready_event.wait()
 
@@ -200,6 +281,7 @@ class ConfigManager:
         if key not in self.all_keys:
             raise InvalidConfigError(f'Configuration "{key}" is invalid.')
         self._cache[key] = item
+        self.bot.dispatch("config_update", key)
 
     def __getitem__(self, key: str) -> typing.Any:
         key = key.lower()
@@ -333,6 +415,7 @@ class ConfigManager:
         if key in self._cache:
             del self._cache[key]
         self._cache[key] = deepcopy(self.defaults[key])
+        self.bot.dispatch("config_update", key)
         return self._cache[key]
 
     def items(self) -> typing.Iterable:
@@ -1,5 +1,6 @@
 import typing
 import asyncio
+from contextlib import suppress
 
 from discord import User, Reaction, Message, Embed
 from discord import HTTPException, InvalidArgument
@@ -142,10 +143,8 @@ class PaginatorSession:
             else:
                 action = self.reaction_map.get(reaction.emoji)
                 await action()
-            try:
+            with suppress(HTTPException, InvalidArgument):
                 await self.base.remove_reaction(reaction, user)
-            except (HTTPException, InvalidArgument):
-                pass
 
     async def previous_page(self) -> None:
         """
@@ -182,10 +181,8 @@ class PaginatorSession:
         if delete:
             return await self.base.delete()
 
-        try:
+        with suppress(HTTPException):
             await self.base.clear_reactions()
-        except HTTPException:
-            pass
 
     async def first_page(self) -> None:
         """
@@ -1,6 +1,8 @@
 import asyncio
 import re
 import typing
+from collections import OrderedDict
+from contextlib import suppress
 from datetime import datetime, timedelta
 from types import SimpleNamespace
 
@@ -11,10 +13,33 @@ from discord.ext.commands import MissingRequiredArgument, CommandError
 
 from core.models import getLogger
 from core.time import human_timedelta
-from core.utils import is_image_url, days, match_user_id, truncate, format_channel_name
+from core.utils import (
+    is_image_url,
+    days,
+    match_user_id,
+    truncate,
+    format_channel_name,
+    key_to_mention,
+    mention_to_key,
+)
 
 logger = getLogger(__name__)
 
+# How far back linked message lookups search a channel's history
+HISTORY_SCAN_LIMIT = 100
+
+LINKED_MESSAGE_ID_REGEX = re.compile(r"#(\d+)$")
+
+
+def linked_message_id(url) -> typing.Optional[int]:
+    """Extracts the linked message ID from the "...#<id>" author URL of a thread embed."""
+    if not url:
+        return None
+    match = LINKED_MESSAGE_ID_REGEX.search(url)
+    if match is None:
+        return None
+    return int(match.group(1))
+
 
 class Thread:
     """Represents a discord Modmail thread"""
@@ -40,6 +65,9 @@ class Thread:
         self._ready_event = asyncio.Event()
         self.close_task = None
         self.auto_close_task = None
+        # Thread channel message ID -> DM message ID (None for notes)
+        self._reply_index = OrderedDict()
+        self._last_reply_id = None
 
     def __repr__(self):
         return f'Thread(recipient="{self.recipient or self.id}", channel={self.channel.id})'
@@ -458,6 +486,19 @@ class Thread:
         message1: discord.Message = None,
         note: bool = True,
     ) -> typing.Tuple[discord.Message, typing.Optional[discord.Message]]:
+        if message1 is None and not either_direction:
+            # Replies and notes sent since startup can be fetched directly
+            indexed_id = self._last_reply_id if message_id is None else message_id
+            if indexed_id in self._reply_index:
+                with suppress(discord.NotFound):
+                    message1 = await self.channel.fetch_message(indexed_id)
+                if message1 is None:
+                    self._reply_index.pop(indexed_id, None)
+                elif self._reply_index[indexed_id] is None:
+                    if not note:
+                        raise ValueError("Thread message not found.")
+                    return message1, None
+
         if message1 is not None:
             if (
                 not message1.embeds
@@ -492,7 +533,7 @@ class Thread:
             ):
                 raise ValueError("Thread message not found.")
         else:
-            async for message1 in self.channel.history():
+            async for message1 in self.channel.history(limit=HISTORY_SCAN_LIMIT):
                 if (
                     message1.embeds
                     and message1.embeds[0].author.url
@@ -504,30 +545,39 @@ class Thread:
                             and message1.embeds[0].color.value == self.bot.recipient_color
                         )
                     )
-                    and message1.embeds[0].author.url.split("#")[-1].isdigit()
+                    and linked_message_id(message1.embeds[0].author.url) is not None
                     and message1.author == self.bot.user
                 ):
                     break
             else:
+                logger.warning(
+                    "No thread message found in the last %d messages of %s.",
+                    HISTORY_SCAN_LIMIT,
+                    self.channel,
+                )
                 raise ValueError("Thread message not found.")
 
-        try:
-            joint_id = int(message1.embeds[0].author.url.split("#")[-1])
-        except ValueError:
+        linked_id = self._reply_index.get(message1.id)
+        if linked_id is not None:
+            with suppress(discord.NotFound):
+                return message1, await self.recipient.fetch_message(linked_id)
+
+        joint_id = linked_message_id(message1.embeds[0].author.url)
+        if joint_id is None:
             raise ValueError("Malformed thread message.")
 
-        async for msg in self.recipient.history():
+        async for msg in self.recipient.history(limit=HISTORY_SCAN_LIMIT):
             if either_direction:
                 if msg.id == joint_id:
                     return message1, msg
 
-            if not (msg.embeds and msg.embeds[0].author.url):
-                continue
-            try:
-                if int(msg.embeds[0].author.url.split("#")[-1]) == joint_id:
-                    return message1, msg
-            except ValueError:
-                continue
+            if msg.embeds and linked_message_id(msg.embeds[0].author.url) == joint_id:
+                return message1, msg
+        logger.warning(
+            "No linked DM message found in the last %d messages with %s.",
+            HISTORY_SCAN_LIMIT,
+            self.recipient,
+        )
         raise ValueError("DM message not found.")
 
     async def edit_message(self, message_id: typing.Optional[int], message: str) -> None:
@@ -555,6 +605,7 @@ class Thread:
             message1, message2 = await self.find_linked_messages(message1=message, note=note)
         else:
             message1, message2 = await self.find_linked_messages(message, note=note)
+        self._forget_reply(message1.id)
         tasks = []
         if not isinstance(message, discord.Message):
             tasks += [message1.delete()]
@@ -569,7 +620,7 @@ class Thread:
         else:
             compare_url = None
 
-        async for linked_message in self.channel.history():
+        async for linked_message in self.channel.history(limit=HISTORY_SCAN_LIMIT):
             if not linked_message.embeds:
                 continue
             url = linked_message.embeds[0].author.url
@@ -578,12 +629,13 @@ class Thread:
             if url == compare_url:
                 return linked_message
 
-            msg_id = url.split("#")[-1]
-            if not msg_id.isdigit():
-                continue
-            msg_id = int(msg_id)
-            if int(msg_id) == message.id:
+            if linked_message_id(url) == message.id:
                 return linked_message
+        logger.warning(
+            "No linked thread message found in the last %d messages of %s.",
+            HISTORY_SCAN_LIMIT,
+            self.channel,
+        )
         raise ValueError("Thread channel message not found.")
 
     async def edit_dm_message(self, message: discord.Message, content: str) -> None:
@@ -604,6 +656,7 @@ class Thread:
             raise MissingRequiredArgument(SimpleNamespace(name="msg"))
 
         msg = await self.send(message, self.channel, note=True)
+        self._index_reply(msg.id, None)
 
         self.bot.loop.create_task(
             self.bot.api.append_log(
@@ -613,6 +666,21 @@ class Thread:
 
         return msg
 
+    def _index_reply(self, message_id: int, linked_id: typing.Optional[int]) -> None:
+        """Remembers the DM message a thread channel message was relayed to."""
+        self._reply_index[message_id] = linked_id
+        if len(self._reply_index) > 100:
+            self._reply_index.popitem(last=False)
+
+    def _forget_reply(self, message_id: int) -> None:
+        """Drops a deleted message from the reply index."""
+        self._reply_index.pop(message_id, None)
+        if self._last_reply_id == message_id:
+            # The previous reply becomes the last one, notes are never picked
+            self._last_reply_id = next(
+                (k for k, v in reversed(self._reply_index.items()) if v is not None), None
+            )
+
     async def reply(self, message: discord.Message, anonymous: bool = False) -> None:
         if not message.content and not message.attachments:
             raise MissingRequiredArgument(SimpleNamespace(name="msg"))
@@ -628,7 +696,7 @@ class Thread:
         tasks = []
 
         try:
-            await self.send(
+            dm_msg = await self.send(
                 message, destination=self.recipient, from_mod=True, anonymous=anonymous
             )
         except Exception:
@@ -649,6 +717,8 @@ class Thread:
             msg = await self.send(
                 message, destination=self.channel, from_mod=True, anonymous=anonymous
             )
+            self._index_reply(msg.id, dm_msg.id)
+            self._last_reply_id = msg.id
 
             tasks.append(
                 self.bot.api.append_log(
@@ -860,12 +930,14 @@ class Thread:
         mentions = []
         mentions.extend(self.bot.config["subscriptions"].get(key, []))
 
-        if key in self.bot.config["notification_squad"]:
-            mentions.extend(self.bot.config["notification_squad"][key])
-            self.bot.config["notification_squad"].pop(key)
+        notifications = self.bot.config["notification_squad"].pop(key, None)
+        if notifications is not None:
+            mentions.extend(notifications)
             self.bot.loop.create_task(self.bot.config.update())
 
-        return " ".join(mentions)
+        # Subscribed and notified at once should still only ping once
+        keys = dict.fromkeys(map(mention_to_key, mentions))
+        return " ".join(map(key_to_mention, keys))
 
 
 class ThreadManager:
@@ -29,6 +29,8 @@ __all__ = [
     "trigger_typing",
     "escape_code_block",
     "format_channel_name",
+    "mention_to_key",
+    "key_to_mention",
 ]
 
 
@@ -227,6 +229,57 @@ def match_user_id(text: str) -> int:
     return -1
 
 
+MENTION_REGEX = re.compile(r"<@([!&]?)(\d+)>")
+
+
+def mention_to_key(mention: str) -> str:
+    """
+    Normalizes a user, role, "@here" or "@everyone" mention into a key,
+    such as "user:12345", "role:12345", "here" or "everyone".
+
+    Parameters
+    ----------
+    mention : str
+        The mention to normalize.
+
+    Returns
+    -------
+    str
+        The normalized key, or `mention` unchanged if it is already a key.
+    """
+    match = MENTION_REGEX.fullmatch(mention)
+    if match is not None:
+        kind = "role" if match.group(1) == "&" else "user"
+        return f"{kind}:{match.group(2)}"
+    if mention in {"@here", "@everyone"}:
+        return mention[1:]
+    return mention
+
+
+def key_to_mention(key: str) -> str:
+    """
+    Renders a key made by `mention_to_key` back into a mention.
+
+    Parameters
+    ----------
+    key : str
+        The key to render.
+
+    Returns
+    -------
+    str
+        The mention, or `key` unchanged if it isn't a known key.
+    """
+    kind, _, id_ = key.partition(":")
+    if kind == "user":
+        return f"<@{id_}>"
+    if kind == "role":
+        return f"<@&{id_}>"
+    if key in {"here", "everyone"}:
+        return "@" + key
+    return key
+
+
 def create_not_found_embed(word, possibilities, name, n=2, cutoff=0.6) -> discord.Embed:
     # Single reference of Color.red()
     embed = discord.Embed(